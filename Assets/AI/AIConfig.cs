@@ -21,5 +21,33 @@ namespace AI.Engine
 
         [Tooltip("Suffix added to the bot's name in chat messages.")]
         public string botNameSuffix = "";
+
+        // Bumped by Inspector edits (OnValidate) and MarkDirty(), so consumers can cheaply detect stale copies
+        [System.NonSerialized]
+        private int version = 0;
+
+        /// <summary>
+        /// Returns a number that changes whenever the settings are edited in the Inspector
+        /// or MarkDirty() is called.
+        /// </summary>
+        public int GetVersion()
+        {
+            return version;
+        }
+
+        /// <summary>
+        /// Call after changing these settings from code. Bumps the version, so AIEngines using
+        /// this asset reload their copy of the settings on their next input.
+        /// </summary>
+        public void MarkDirty()
+        {
+            version++;
+        }
+
+        // Settings edited in the Inspector
+        private void OnValidate()
+        {
+            MarkDirty();
+        }
     }
 }
\ No newline at end of file
@@ -1,8 +1,7 @@
 using UdonSharp;
 using UnityEngine;
-using System.Text.RegularExpressions; // Required for Regex
 using VRC.Udon;
-using System; // Includes Linq, Collections.Generic, Tuple
+using System; // Includes Linq, Collections.Generic
 using System.Collections.Generic; // Explicitly include for clarity
 // using System.Linq; // Included via System
 
@@ -24,18 +23,64 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
         [Range(1, 20)]
         public int conversationHistoryLength = 5; // Store 5 turns (10 messages)
 
+        [Header("Performance")]
+        [Tooltip("Number of recent distinct inputs whose responses are cached (0 disables the cache). Repeated inputs like greetings skip matching entirely.")]
+        [Range(0, 1024)]
+        public int responseCacheSize = 64;
+
         [Header("Debug")]
         [Tooltip("Enable detailed logging for AI processing.")]
         public bool debugMode = false;
 
-        // Stores pairs of (User Message, Bot Response)
-        private List<Tuple<string, string>> conversationHistory;
+        // Fixed-size ring buffer of turns (User Message, Bot Response). The oldest turn is
+        // overwritten once full, instead of shifting the whole list with RemoveAt(0).
+        private string[] historyUserMessages;
+        private string[] historyBotResponses;
+        private int historyStart = 0; // Index of the oldest turn
+        private int historyCount = 0;
+        // Formatted history is cached until the history changes (version bumped on every update)
+        private int conversationHistoryVersion = 0;
+        private int cachedHistoryVersion = -1;
+        private string cachedHistoryString;
+
+        // debugMode only: FindResponse details are collected here and written as one log per input,
+        // since each Debug.Log call captures a stack trace and writes to the console/log file.
+        private System.Text.StringBuilder debugLogBuilder = new System.Text.StringBuilder();
+
         private bool isInitialized = false;
 
-        // Regex is potentially heavy, use static IsMatch which is generally safe in Udon.
-        // Pre-compiling the Regex object itself (like wordBoundaryRegex below) might offer
-        // minor gains but isn't strictly necessary for the current static IsMatch usage.
-        // private static readonly Regex wordBoundaryRegex = new Regex(@"\b", RegexOptions.Compiled | RegexOptions.IgnoreCase);
+        // Recent input -> FindResponse result (null = no match). Keys are case-insensitive, like
+        // the matching itself. responseCache maps a key to its slot; when full, the least recently
+        // used slot (lowest responseCacheLastUsed tick) is evicted.
+        private Dictionary<string, int> responseCache;
+        private string[] responseCacheKeys;
+        private string[] responseCacheValues;
+        private int[] responseCacheLastUsed;
+        private int responseCacheCount = 0;
+        private int responseCacheTick = 0;
+
+        // AIConfig values read once in ReloadConfig() instead of on every message
+        private float keywordMatchThreshold;
+        private string defaultResponse;
+
+        // Asset versions the cached config/index were built from; checked per input so that
+        // Inspector edits and MarkDirty() calls are picked up without re-reading unchanged
+        // assets (see EnsureUpToDate)
+        private AIConfig loadedConfig;
+        private int loadedConfigVersion = -1;
+        private KnowledgeBase indexedKnowledgeBase;
+        private KnowledgeBase.KnowledgeEntry[] indexedEntries; // Detects 'entries' being replaced by code
+        private int indexedKnowledgeBaseVersion = -1;
+
+        // --- Keyword Index (Aho-Corasick automaton) ---
+        // Built once from the knowledge base in RebuildIndex() so that matching an input
+        // is a single linear pass over the text instead of one Regex per keyword per entry.
+        private List<Dictionary<char, int>> automatonGoto; // state -> (char -> next state)
+        private int[] automatonFail;                       // state -> failure link
+        private List<List<int>> automatonOutput;           // state -> keyword ids ending here
+        private string[] indexedKeywords;                  // keyword id -> lowercase keyword
+        private int[][] entryKeywordIds;                   // entry index -> keyword ids (one per valid keyword)
+        private bool[] keywordMatched;                     // scratch buffer reused by FindResponse
 
 
         void Start()
@@ -66,10 +111,17 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
                  LogWarning("Knowledge Base is assigned but contains no entries. AI will only use default responses.");
             }
 
+            // --- Allocate Response Cache ---
+            AllocateResponseCache();
+
+            // --- Cache Config Values ---
+            ReloadConfig();
+
+            // --- Build Keyword Index ---
+            RebuildIndex();
+
             // --- Initialize History ---
-            // Ensure capacity is non-negative
-            int historyCapacity = Mathf.Max(0, conversationHistoryLength);
-            conversationHistory = new List<Tuple<string, string>>(historyCapacity);
+            AllocateConversationHistory();
 
             isInitialized = true;
             if (debugMode) Log("AIEngine Initialized successfully.");
@@ -90,24 +142,27 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
                  return "Sorry, the AI Engine is not configured correctly.";
             }
 
+            // --- Refresh Cached Config/Index If The Assets Changed ---
+            EnsureUpToDate();
+
             // --- Handle Empty Input ---
             if (string.IsNullOrWhiteSpace(userInput))
             {
                 if (debugMode) LogWarning("Received empty or whitespace input.");
-                // Use the default response defined in the AIConfig asset
-                return aiConfig.defaultResponse;
+                // Use the default response defined in the AIConfig asset (cached)
+                return defaultResponse;
             }
 
             // --- Process Input ---
             string processedInput = userInput.Trim();
             if (debugMode) Log($"Processing input: '{processedInput}'");
 
-            string response = FindResponse(processedInput);
+            string response = FindResponseCached(processedInput);
 
             // Use default response if no specific match found
             if (string.IsNullOrEmpty(response))
             {
-                response = aiConfig.defaultResponse;
+                response = defaultResponse;
                 if (debugMode) Log($"No specific response found, using default: '{response}'");
             } else {
                 if (debugMode) Log($"Found response: '{response}'");
@@ -121,6 +176,103 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
             return response;
         }
 
+        /// <summary>
+        /// Returns the FindResponse result for this input, reusing it if the same input
+        /// (ignoring case) was answered recently.
+        /// </summary>
+        private string FindResponseCached(string input)
+        {
+            // Follow runtime changes to responseCacheSize
+            if (responseCacheKeys == null) AllocateResponseCache();
+            else if (responseCacheKeys.Length != Mathf.Max(0, responseCacheSize)) ResizeResponseCache();
+
+            int capacity = responseCacheKeys.Length;
+            if (capacity == 0) return FindResponse(input); // Cache disabled
+
+            int slot;
+            if (responseCache.TryGetValue(input, out slot))
+            {
+                if (debugMode) Log($"Response cache hit for '{input}'.");
+                responseCacheLastUsed[slot] = ++responseCacheTick;
+                return responseCacheValues[slot];
+            }
+
+            string response = FindResponse(input);
+
+            if (responseCacheCount < capacity)
+            {
+                slot = responseCacheCount++;
+            }
+            else
+            {
+                // Evict the least recently used entry. The linear scan only runs on a miss,
+                // which already paid for a full FindResponse.
+                slot = 0;
+                for (int i = 1; i < capacity; i++)
+                {
+                    if (responseCacheLastUsed[i] < responseCacheLastUsed[slot]) slot = i;
+                }
+                responseCache.Remove(responseCacheKeys[slot]);
+            }
+            responseCacheKeys[slot] = input;
+            responseCacheValues[slot] = response;
+            responseCacheLastUsed[slot] = ++responseCacheTick;
+            responseCache[input] = slot;
+
+            return response;
+        }
+
+        private void AllocateResponseCache()
+        {
+            int cacheCapacity = Mathf.Max(0, responseCacheSize);
+            responseCache = new Dictionary<string, int>(cacheCapacity, StringComparer.OrdinalIgnoreCase);
+            responseCacheKeys = new string[cacheCapacity];
+            responseCacheValues = new string[cacheCapacity];
+            responseCacheLastUsed = new int[cacheCapacity];
+            responseCacheCount = 0;
+        }
+
+        // Reallocates the cache for the current responseCacheSize, keeping the most recently used entries
+        private void ResizeResponseCache()
+        {
+            string[] oldKeys = responseCacheKeys;
+            string[] oldValues = responseCacheValues;
+            int[] oldLastUsed = responseCacheLastUsed;
+            int oldCount = responseCacheCount;
+
+            AllocateResponseCache();
+
+            // Order the old slots by last use, oldest first
+            int[] order = new int[oldCount];
+            int[] ticks = new int[oldCount];
+            for (int i = 0; i < oldCount; i++)
+            {
+                order[i] = i;
+                ticks[i] = oldLastUsed[i];
+            }
+            Array.Sort(ticks, order);
+
+            int keep = Mathf.Min(oldCount, responseCacheKeys.Length);
+            for (int i = 0; i < keep; i++)
+            {
+                int oldSlot = order[oldCount - keep + i];
+                responseCacheKeys[i] = oldKeys[oldSlot];
+                responseCacheValues[i] = oldValues[oldSlot];
+                responseCacheLastUsed[i] = oldLastUsed[oldSlot];
+                responseCache[oldKeys[oldSlot]] = i;
+            }
+            responseCacheCount = keep;
+        }
+
+        private void ClearResponseCache()
+        {
+            if (responseCache == null) return;
+            responseCache.Clear();
+            Array.Clear(responseCacheKeys, 0, responseCacheKeys.Length);
+            Array.Clear(responseCacheValues, 0, responseCacheValues.Length);
+            responseCacheCount = 0;
+        }
+
         /// <summary>
         /// Searches the knowledge base for the best matching entry based on keywords.
         /// </summary>
@@ -136,11 +288,16 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
             string bestMatchResponse = null;
             float bestScore = -1f; // Start below threshold
 
-            // Prepare input for matching (lowercase, invariant culture)
-            string lowerInput = input.ToLowerInvariant();
+            if (debugMode) debugLogBuilder.Clear().AppendLine($"Matching input: '{input}'");
+
+            // --- Find every indexed keyword present in the input (single pass) ---
+            // Case folding happens per character inside the scan, so no lowercased copy is allocated.
+            MatchKeywords(input);
 
             // --- Iterate through Knowledge Base Entries ---
-            for (int i = 0; i < knowledgeBase.entries.Length; i++)
+            // Bounded by the index as well, in case 'entries' was resized without a RebuildIndex()
+            int entryCount = Mathf.Min(knowledgeBase.entries.Length, entryKeywordIds.Length);
+            for (int i = 0; i < entryCount; i++)
             {
                 KnowledgeBase.KnowledgeEntry entry = knowledgeBase.entries[i];
 
@@ -148,94 +305,292 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
                 if (entry.keywords == null || entry.keywords.Length == 0) continue;
 
                 // Calculate match score for this entry
-                float currentScore = CalculateKeywordMatchScore(lowerInput, entry.keywords);
+                float currentScore = CalculateKeywordMatchScore(entryKeywordIds[i]);
 
                 if (debugMode) {
-                     // Avoid potential System.Linq reference for String.Join in log if problematic
-                     // string keywordsString = "";
-                     // for(int k=0; k < entry.keywords.Length; k++) keywordsString += (k > 0 ? ", " : "") + entry.keywords[k];
-                     // Debug.Log($"Entry {i}, Keywords: [{keywordsString}], Score: {currentScore}");
                      // Using string.Join is generally fine in UdonSharp:
-                     Debug.Log($"Entry {i}, Keywords: [{string.Join(", ", entry.keywords)}], Score: {currentScore}");
+                     debugLogBuilder.AppendLine($"Entry {i}, Keywords: [{string.Join(", ", entry.keywords)}], Score: {currentScore}");
                 }
 
 
                 // Check if this is the best score so far AND meets the threshold
-                if (currentScore > bestScore && currentScore >= aiConfig.keywordMatchThreshold)
+                if (currentScore > bestScore && currentScore >= keywordMatchThreshold)
                 {
                     bestScore = currentScore;
                     bestMatchResponse = entry.response;
 
-                    if (debugMode) Log($"New best match! Entry {i}, Score: {bestScore}, Response: '{bestMatchResponse}'");
+                    if (debugMode) debugLogBuilder.AppendLine($"New best match! Entry {i}, Score: {bestScore}, Response: '{bestMatchResponse}'");
 
                     // Optional Optimization: Early exit if a perfect score (1.0) is found
                     // if (bestScore >= 1.0f) break;
                 }
             }
 
+            // Write all matching details for this input as a single log entry
+            if (debugMode) Log(debugLogBuilder.ToString());
+
             return bestMatchResponse; // Returns null if no suitable match found
         }
 
         /// <summary>
-        /// Calculates a match score (0-1) based on the percentage of keywords found in the input.
-        /// Uses whole-word matching with Regex.
+        /// Copies the matching settings from the AIConfig asset into this component.
+        /// Runs automatically when another AIConfig is assigned, after Inspector edits, or after
+        /// AIConfig.MarkDirty(); other changes to the AIConfig fields from code are only picked
+        /// up by calling this (or MarkDirty()).
         /// </summary>
-        private float CalculateKeywordMatchScore(string lowerInput, string[] keywords)
+        public void ReloadConfig()
         {
-            if (keywords == null || keywords.Length == 0) return 0f;
+            if (aiConfig == null) return;
+            keywordMatchThreshold = aiConfig.keywordMatchThreshold;
+            defaultResponse = aiConfig.defaultResponse;
+            loadedConfig = aiConfig;
+            loadedConfigVersion = aiConfig.GetVersion();
+            ClearResponseCache(); // Cached results depend on keywordMatchThreshold
+        }
 
-            int matchedKeywords = 0;
-            int validKeywords = 0; // Count non-empty keywords
+        /// <summary>
+        /// Reloads the config and/or rebuilds the keyword index only if the assigned assets
+        /// were swapped or their versions changed since they were last read. Otherwise this is a
+        /// cheap check. Versions only change on Inspector edits (OnValidate) or MarkDirty(), and
+        /// KnowledgeBase.entries is compared by reference: code that edits either asset's fields
+        /// in place must call MarkDirty() on it.
+        /// </summary>
+        private void EnsureUpToDate()
+        {
+            if (aiConfig != loadedConfig || aiConfig.GetVersion() != loadedConfigVersion)
+            {
+                if (debugMode) Log("AIConfig changed, reloading settings.");
+                ReloadConfig();
+            }
+            if (knowledgeBase != indexedKnowledgeBase || knowledgeBase.entries != indexedEntries
+                || knowledgeBase.GetVersion() != indexedKnowledgeBaseVersion)
+            {
+                if (debugMode) Log("Knowledge Base changed, rebuilding keyword index.");
+                RebuildIndex();
+            }
+        }
+
+        /// <summary>
+        /// Rebuilds the keyword index from the knowledge base. Normally called automatically:
+        /// EnsureUpToDate rebuilds when 'entries' is replaced or after KnowledgeBase.MarkDirty()
+        /// (which code must call after editing entries in place).
+        /// </summary>
+        public void RebuildIndex()
+        {
+            int entryCount = (knowledgeBase != null && knowledgeBase.entries != null) ? knowledgeBase.entries.Length : 0;
+
+            // Root state (0) with no transitions
+            automatonGoto = new List<Dictionary<char, int>>();
+            automatonOutput = new List<List<int>>();
+            automatonGoto.Add(new Dictionary<char, int>());
+            automatonOutput.Add(new List<int>());
+
+            entryKeywordIds = new int[entryCount][];
+            List<string> keywords = new List<string>();
+            Dictionary<string, int> keywordIds = new Dictionary<string, int>(); // Shared keywords get one id
+
+            // --- Insert every keyword into the trie ---
+            // KnowledgeBase caches the lowercased/trimmed keywords, so they are only normalized once
+            // (shared by every AIEngine using the asset)
+            string[][] normalizedKeywords = entryCount > 0 ? knowledgeBase.GetNormalizedKeywords() : null;
+            for (int i = 0; i < entryCount; i++)
+            {
+                string[] entryKeywords = normalizedKeywords[i];
+                int[] ids = new int[entryKeywords.Length];
 
-            for (int i = 0; i < keywords.Length; i++)
+                for (int k = 0; k < entryKeywords.Length; k++)
+                {
+                    int id;
+                    if (!keywordIds.TryGetValue(entryKeywords[k], out id))
+                    {
+                        id = keywords.Count;
+                        keywords.Add(entryKeywords[k]);
+                        keywordIds.Add(entryKeywords[k], id);
+                        AddKeywordToTrie(entryKeywords[k], id);
+                    }
+                    ids[k] = id;
+                }
+                entryKeywordIds[i] = ids;
+            }
+
+            indexedKeywords = keywords.ToArray();
+            indexedKnowledgeBase = knowledgeBase;
+            indexedEntries = knowledgeBase != null ? knowledgeBase.entries : null;
+            indexedKnowledgeBaseVersion = knowledgeBase != null ? knowledgeBase.GetVersion() : -1;
+            ClearResponseCache(); // Cached results came from the old index
+            keywordMatched = new bool[indexedKeywords.Length];
+
+            // --- Compute failure links breadth-first ---
+            automatonFail = new int[automatonGoto.Count];
+            Queue<int> pending = new Queue<int>();
+            foreach (var transition in automatonGoto[0])
+            {
+                automatonFail[transition.Value] = 0;
+                pending.Enqueue(transition.Value);
+            }
+            while (pending.Count > 0)
+            {
+                int state = pending.Dequeue();
+                foreach (var transition in automatonGoto[state])
+                {
+                    int next = transition.Value;
+                    int fallback = automatonFail[state];
+                    int target;
+                    while (fallback != 0 && !automatonGoto[fallback].ContainsKey(transition.Key)) fallback = automatonFail[fallback];
+                    automatonFail[next] = automatonGoto[fallback].TryGetValue(transition.Key, out target) ? target : 0;
+
+                    // A state also reports every keyword reported by its failure state
+                    automatonOutput[next].AddRange(automatonOutput[automatonFail[next]]);
+                    pending.Enqueue(next);
+                }
+            }
+
+            if (debugMode) Log($"Keyword index built: {indexedKeywords.Length} keywords, {automatonGoto.Count} states.");
+        }
+
+        private void AddKeywordToTrie(string keyword, int id)
+        {
+            int state = 0;
+            for (int c = 0; c < keyword.Length; c++)
             {
-                // Skip null or empty keywords in the definition
-                if (string.IsNullOrWhiteSpace(keywords[i])) continue;
+                int next;
+                if (!automatonGoto[state].TryGetValue(keyword[c], out next))
+                {
+                    next = automatonGoto.Count;
+                    automatonGoto.Add(new Dictionary<char, int>());
+                    automatonOutput.Add(new List<int>());
+                    automatonGoto[state].Add(keyword[c], next);
+                }
+                state = next;
+            }
+            automatonOutput[state].Add(id);
+        }
 
-                validKeywords++; // This is a keyword we should check for
-                string lowerKeyword = keywords[i].ToLowerInvariant().Trim();
+        /// <summary>
+        /// Runs the automaton over the input once and flags every keyword found as a whole word
+        /// (same semantics as the previous \b keyword \b Regex) in keywordMatched.
+        /// Matching is case-insensitive (invariant culture).
+        /// Every keyword is reported, including overlapping ones such as "new" and "new york";
+        /// a single alternation Regex would only report one of those per position.
+        /// </summary>
+        private void MatchKeywords(string input)
+        {
+            Array.Clear(keywordMatched, 0, keywordMatched.Length);
 
-                // --- Use static Regex.IsMatch for whole-word matching ---
-                // Pattern: \b = word boundary, Regex.Escape handles special chars in keyword
-                string pattern = @"\b" + Regex.Escape(lowerKeyword) + @"\b";
+            int state = 0;
+            for (int i = 0; i < input.Length; i++)
+            {
+                char c = char.ToLowerInvariant(input[i]);
+                int next;
+                while (state != 0 && !automatonGoto[state].ContainsKey(c)) state = automatonFail[state];
+                state = automatonGoto[state].TryGetValue(c, out next) ? next : 0;
+
+                List<int> output = automatonOutput[state];
+                for (int o = 0; o < output.Count; o++)
+                {
+                    int id = output[o];
+                    if (keywordMatched[id]) continue;
 
-                try {
-                    // Static Regex.IsMatch is generally safe in UdonSharp
-                    if (Regex.IsMatch(lowerInput, pattern, RegexOptions.IgnoreCase))
+                    string keyword = indexedKeywords[id];
+                    int start = i - keyword.Length + 1;
+                    if (IsWordBoundary(input, start) && IsWordBoundary(input, i + 1))
                     {
-                        matchedKeywords++;
-                        if (debugMode) Log($"Keyword '{lowerKeyword}' matched in input.");
+                        keywordMatched[id] = true;
+                        if (debugMode) debugLogBuilder.AppendLine($"Keyword '{keyword}' matched in input.");
                     }
-                } catch (Exception e) {
-                    // Log Regex errors if they occur, though unlikely for IsMatch with simple patterns
-                    LogError($"Regex error matching keyword '{lowerKeyword}': {e.Message}");
                 }
             }
+        }
+
+        // Equivalent of Regex \b: the characters on either side of 'position' differ in being word characters
+        private static bool IsWordBoundary(string text, int position)
+        {
+            bool before = position > 0 && IsWordChar(text[position - 1]);
+            bool after = position < text.Length && IsWordChar(text[position]);
+            return before != after;
+        }
 
+        // Same set as .NET Regex \w: [\p{L}\p{Mn}\p{Nd}\p{Pc}] (letters, combining marks, digits, '_' etc.)
+        private static bool IsWordChar(char c)
+        {
+            if (char.IsLetterOrDigit(c)) return true;
+            System.Globalization.UnicodeCategory category = char.GetUnicodeCategory(c);
+            return category == System.Globalization.UnicodeCategory.NonSpacingMark
+                || category == System.Globalization.UnicodeCategory.ConnectorPunctuation;
+        }
+
+        /// <summary>
+        /// Calculates a match score (0-1) based on the percentage of an entry's keywords found in the input.
+        /// Relies on keywordMatched having been filled by MatchKeywords for the current input.
+        /// </summary>
+        private float CalculateKeywordMatchScore(int[] keywordIds)
+        {
             // Avoid division by zero if no valid keywords were defined
-            if (validKeywords == 0) return 0f;
+            if (keywordIds == null || keywordIds.Length == 0) return 0f;
+
+            int matchedKeywords = 0;
+            for (int i = 0; i < keywordIds.Length; i++)
+            {
+                if (keywordMatched[keywordIds[i]]) matchedKeywords++;
+            }
 
             // Normalize the score: (matched count) / (total *valid* keywords)
-            return (float)matchedKeywords / validKeywords;
+            return (float)matchedKeywords / keywordIds.Length;
+        }
+
+        private void AllocateConversationHistory()
+        {
+            // Ensure capacity is non-negative
+            int historyCapacity = Mathf.Max(0, conversationHistoryLength);
+            historyUserMessages = new string[historyCapacity];
+            historyBotResponses = new string[historyCapacity];
+            historyStart = 0;
+            historyCount = 0;
+        }
+
+        // Reallocates the ring buffer for the current conversationHistoryLength, keeping the newest turns
+        private void ResizeConversationHistory()
+        {
+            string[] oldUserMessages = historyUserMessages;
+            string[] oldBotResponses = historyBotResponses;
+            int oldStart = historyStart;
+            int oldCount = historyCount;
+
+            AllocateConversationHistory();
+
+            int keep = Mathf.Min(oldCount, historyUserMessages.Length);
+            for (int i = 0; i < keep; i++)
+            {
+                int oldIndex = (oldStart + oldCount - keep + i) % oldUserMessages.Length;
+                historyUserMessages[i] = oldUserMessages[oldIndex];
+                historyBotResponses[i] = oldBotResponses[oldIndex];
+            }
+            historyCount = keep;
+            conversationHistoryVersion++; // Invalidate the formatted history cache
         }
 
         /// <summary>
-        /// Adds the latest user message and bot response to the history, trimming old entries.
+        /// Adds the latest user message and bot response to the history, overwriting the oldest turn when full.
         /// </summary>
         private void UpdateConversationHistory(string userMessage, string botResponse)
         {
-            // Ensure list exists (should be handled by Initialize)
-            if (conversationHistory == null) conversationHistory = new List<Tuple<string, string>>();
+            // Ensure buffers exist (should be handled by Initialize) and follow runtime changes
+            // to conversationHistoryLength
+            if (historyUserMessages == null) AllocateConversationHistory();
+            else if (historyUserMessages.Length != Mathf.Max(0, conversationHistoryLength)) ResizeConversationHistory();
 
-            // Add the new turn (user message, bot response)
-            conversationHistory.Add(Tuple.Create(userMessage, botResponse));
+            int capacity = historyUserMessages.Length;
+            if (capacity == 0) return; // History disabled
 
-            // Remove oldest entries if history exceeds the desired length
-            // Use conversationHistoryLength which is checked >= 0 in Initialize
-            while (conversationHistory.Count > conversationHistoryLength)
-            {
-                conversationHistory.RemoveAt(0); // Remove the oldest turn (index 0)
-            }
+            // Write the new turn into the next free slot, or over the oldest turn if full
+            int index = (historyStart + historyCount) % capacity;
+            historyUserMessages[index] = userMessage;
+            historyBotResponses[index] = botResponse;
+
+            if (historyCount < capacity) historyCount++;
+            else historyStart = (historyStart + 1) % capacity; // Oldest turn was overwritten
+
+            conversationHistoryVersion++; // Invalidate the formatted history cache
         }
 
         /// <summary>
@@ -243,21 +598,31 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
         /// </summary>
         public string GetConversationHistoryAsString()
         {
-            if (conversationHistory == null || conversationHistory.Count == 0)
+            if (historyUserMessages == null || historyCount == 0)
             {
                 return "No conversation history yet.";
             }
 
+            // Reuse the last formatted string if the history hasn't changed since
+            if (cachedHistoryVersion == conversationHistoryVersion && cachedHistoryString != null)
+            {
+                return cachedHistoryString;
+            }
+
             // Use StringBuilder for efficient string building in loops
             System.Text.StringBuilder sb = new System.Text.StringBuilder();
             sb.AppendLine("--- Conversation History ---");
-            foreach (var turn in conversationHistory) // Tuple<string, string>
+            for (int i = 0; i < historyCount; i++) // Oldest to newest
             {
-                sb.AppendLine($"User: {turn.Item1}"); // Item1 = userMessage
-                sb.AppendLine($"Bot: {turn.Item2}");  // Item2 = botResponse
+                int index = (historyStart + i) % historyUserMessages.Length;
+                sb.AppendLine($"User: {historyUserMessages[index]}");
+                sb.AppendLine($"Bot: {historyBotResponses[index]}");
             }
             sb.AppendLine("--------------------------");
-            return sb.ToString();
+
+            cachedHistoryString = sb.ToString();
+            cachedHistoryVersion = conversationHistoryVersion;
+            return cachedHistoryString;
         }
 
         /// <summary>
@@ -265,7 +630,7 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
         /// </summary>
         private void LogConversationHistory()
         {
-            if (!debugMode || conversationHistory == null) return;
+            if (!debugMode || historyUserMessages == null) return;
             // Use the helper method to get the formatted string
             Log(GetConversationHistoryAsString());
         }
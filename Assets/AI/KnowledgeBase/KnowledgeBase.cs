@@ -14,5 +14,83 @@ namespace AI.Engine
         }
 
         public KnowledgeEntry[] entries;
+
+        // Lowercased, trimmed keywords per entry (empty keywords removed). Built on first use.
+        [System.NonSerialized]
+        private string[][] normalizedKeywords;
+        [System.NonSerialized]
+        private KnowledgeEntry[] normalizedEntries; // The 'entries' array the cache was built from
+
+        // Bumped by Inspector edits (OnValidate) and MarkDirty(), so consumers can cheaply detect stale indexes
+        [System.NonSerialized]
+        private int version = 0;
+
+        /// <summary>
+        /// Returns a number that changes whenever the entries are edited in the Inspector
+        /// or MarkDirty() is called.
+        /// Compare against a previously seen value to know whether derived data must be rebuilt.
+        /// </summary>
+        public int GetVersion()
+        {
+            return version;
+        }
+
+        /// <summary>
+        /// Returns the keywords of every entry, lowercased (invariant culture) and trimmed,
+        /// with null/whitespace keywords dropped. Indexed the same as 'entries'.
+        /// The result is cached (rebuilt automatically if 'entries' is replaced or resized);
+        /// do not modify the returned arrays.
+        /// </summary>
+        public string[][] GetNormalizedKeywords()
+        {
+            int entryCount = entries != null ? entries.Length : 0;
+            if (normalizedKeywords == null || normalizedEntries != entries || normalizedKeywords.Length != entryCount)
+            {
+                normalizedKeywords = BuildNormalizedKeywords();
+                normalizedEntries = entries;
+            }
+            return normalizedKeywords;
+        }
+
+        /// <summary>
+        /// Call after editing entries in place from code (e.g. changing an entry's keywords).
+        /// Drops the cached normalized keywords and bumps the version, so AIEngines using this
+        /// asset rebuild their keyword index on their next input. Replacing the whole 'entries'
+        /// array is detected automatically.
+        /// </summary>
+        public void MarkDirty()
+        {
+            normalizedKeywords = null;
+            version++;
+        }
+
+        private string[][] BuildNormalizedKeywords()
+        {
+            int entryCount = entries != null ? entries.Length : 0;
+            string[][] result = new string[entryCount][];
+
+            for (int i = 0; i < entryCount; i++)
+            {
+                string[] keywords = entries[i].keywords;
+                int validCount = 0;
+                string[] normalized = new string[keywords != null ? keywords.Length : 0];
+
+                for (int k = 0; k < normalized.Length; k++)
+                {
+                    if (string.IsNullOrWhiteSpace(keywords[k])) continue;
+                    normalized[validCount++] = keywords[k].ToLowerInvariant().Trim();
+                }
+
+                if (validCount != normalized.Length) System.Array.Resize(ref normalized, validCount);
+                result[i] = normalized;
+            }
+            return result;
+        }
+
+        // Entries edited in the Inspector invalidate the cache
+        private void OnValidate()
+        {
+            MarkDirty();
+        }
     }
-}
\ No newline at end of file
+}
@@ -64,7 +64,12 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
         private bool isSpeaking = false; // Tracks if TTS is *supposedly* active (Editor only)
         private AudioClip currentClip; // Store the generated clip to destroy later
         private Coroutine lipSyncCoroutine; // Store coroutine to stop it reliably
-        private SpeechSynthesizer synthesizer; // Keep synthesizer instance for reuse? Check disposal needs.
+        private SpeechSynthesizer synthesizer; // Reused across Speak() calls, disposed in OnDestroy
+        // Voice name resolved from voiceIndex and reused until voiceIndex changes
+        // (enumerating installed SAPI voices is slow). Null means "use the default voice".
+        private string cachedVoiceName;
+        private int resolvedVoiceIndex = -1; // voiceIndex cachedVoiceName was resolved for (-1 = not yet)
+        private string selectedVoiceName;    // Voice last applied to the current synthesizer
         #endif
 
         [Header("Debug")]
@@ -88,9 +93,7 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
                 if (avatarAnimator == null) {
                     LogWarning("Avatar Animator is not assigned. Lip sync will be disabled (even in Editor).");
                 }
-                // Pre-initialize synthesizer? Or create on demand in Speak()?
-                // Consider potential overhead vs. initialization delay. For now, create on demand.
-                // synthesizer = new SpeechSynthesizer();
+                // The synthesizer is created on the first Speak() and then reused.
             #else
                 // Log warning if running outside Windows Editor context
                 LogWarning("TTS functionality is disabled outside of Windows Editor.");
@@ -123,68 +126,82 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
 
             try
             {
-                // --- Synthesizer Initialization (On Demand) ---
-                // Using 'using' ensures disposal even if errors occur
-                using (synthesizer = new SpeechSynthesizer())
+                // --- Synthesizer Initialization (Once, Reused) ---
+                // Created on the first Speak() and kept for the lifetime of the component;
+                // disposed in OnDestroy (or after an error, so the next call starts fresh).
+                if (synthesizer == null) CreateSynthesizer();
+
+                // --- Voice Selection (re-resolved only when voiceIndex changes) ---
+                if (voiceIndex != resolvedVoiceIndex)
                 {
-                    // --- Voice Selection ---
+                    ResolveVoiceName(synthesizer);
+
+                    // No voice for the new index: a reused synthesizer would keep the previous
+                    // voice, so start a fresh one on the default voice instead
+                    if (cachedVoiceName == null && selectedVoiceName != null)
+                    {
+                        DisposeSynthesizer();
+                        CreateSynthesizer();
+                    }
+                }
+                if (cachedVoiceName != null && cachedVoiceName != selectedVoiceName) {
+                    selectedVoiceName = cachedVoiceName; // Don't retry (and re-warn) every call on failure
                     try {
-                         var voices = synthesizer.GetInstalledVoices().Where(v => v.Enabled).ToList();
-                         if (voices.Count > 0) {
-                             synthesizer.SelectVoice(voices[Mathf.Clamp(voiceIndex, 0, voices.Count - 1)].VoiceInfo.Name);
-                         } else {
-                             LogWarning("No enabled voices found for System.Speech.");
-                         }
+                        synthesizer.SelectVoice(cachedVoiceName);
                     } catch (Exception e) {
-                        LogWarning($"Failed to select voice (using default): {e.Message}");
+                        LogWarning($"Failed to select voice '{cachedVoiceName}' (using default): {e.Message}");
                     }
+                }
 
-                    // --- Rate & Volume ---
-                    synthesizer.Rate = Mathf.Clamp((int)((speechRate - 1.0f) * 10.0f), -10, 10);
-                    synthesizer.Volume = 100;
+                // --- Rate (re-applied each call so Inspector changes take effect) ---
+                synthesizer.Rate = Mathf.Clamp((int)((speechRate - 1.0f) * 10.0f), -10, 10);
 
-                    if (debugMode) Debug.Log($"[TTSManager EDITOR] Attempting to speak: '{text}' Rate: {synthesizer.Rate}");
+                if (debugMode) Debug.Log($"[TTSManager EDITOR] Attempting to speak: '{text}' Rate: {synthesizer.Rate}");
 
-                    // --- Generate Audio Stream ---
-                    using (MemoryStream stream = new MemoryStream())
-                    {
+                // --- Generate Audio Stream ---
+                using (MemoryStream stream = new MemoryStream())
+                {
+                    try {
                         synthesizer.SetOutputToWaveStream(stream);
                         synthesizer.Speak(text); // Synchronous call
+                    } finally {
+                        // Detach the stream before it is disposed, the synthesizer outlives it
+                        synthesizer.SetOutputToNull();
+                    }
 
-                        if (stream.Length > 0)
+                    if (stream.Length > 0)
+                    {
+                        stream.Position = 0;
+                        // --- Convert Stream to AudioClip using NAudio ---
+                        using (WaveFileReader waveReader = new WaveFileReader(stream))
                         {
-                            stream.Position = 0;
-                            // --- Convert Stream to AudioClip using NAudio ---
-                            using (WaveFileReader waveReader = new WaveFileReader(stream))
+                            if (currentClip != null) DestroyImmediate(currentClip); // Use DestroyImmediate in Editor
+
+                            // Helper function or direct code to convert WaveFileReader to AudioClip
+                            currentClip = NAudioToAudioClip.FromWaveFileReader(waveReader, "TTS_Clip_Editor");
+
+                            if (currentClip != null)
                             {
-                                if (currentClip != null) DestroyImmediate(currentClip); // Use DestroyImmediate in Editor
-
-                                // Helper function or direct code to convert WaveFileReader to AudioClip
-                                currentClip = NAudioToAudioClip.FromWaveFileReader(waveReader, "TTS_Clip_Editor");
-
-                                if (currentClip != null)
-                                {
-                                     audioSource.clip = currentClip;
-                                     audioSource.Play();
-                                     isSpeaking = true;
-                                     StartLipSync(text); // Start lip sync only if audio plays
-                                } else {
-                                     LogError("Failed to create AudioClip from TTS stream (NAudio).");
-                                     isSpeaking = false;
-                                }
+                                 audioSource.clip = currentClip;
+                                 audioSource.Play();
+                                 isSpeaking = true;
+                                 StartLipSync(text); // Start lip sync only if audio plays
+                            } else {
+                                 LogError("Failed to create AudioClip from TTS stream (NAudio).");
+                                 isSpeaking = false;
                             }
                         }
-                        else {
-                            LogWarning("TTS generated empty audio stream.");
-                            isSpeaking = false;
-                        }
-                    } // Dispose MemoryStream
-                } // Dispose SpeechSynthesizer
-                synthesizer = null; // Clear reference after disposal
+                    }
+                    else {
+                        LogWarning("TTS generated empty audio stream.");
+                        isSpeaking = false;
+                    }
+                } // Dispose MemoryStream
             }
             catch (PlatformNotSupportedException) {
                  LogError("System.Speech is not supported on this platform (Requires Windows Editor). Ensure DLLs are present.");
                  isSpeaking = false;
+                 DisposeSynthesizer();
             }
             catch (Exception e)
             {
@@ -194,6 +211,7 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
                      DestroyImmediate(currentClip); // Use DestroyImmediate in Editor
                      currentClip = null;
                  }
+                 DisposeSynthesizer();
             }
 
             #else
@@ -246,7 +264,36 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
              // No action needed outside Windows editor
         }
 
-        #if UNITY_EDITOR_WIN // --- Lip Sync Logic (Windows Editor Only) ---
+        #if UNITY_EDITOR_WIN // --- Voice Selection & Lip Sync Logic (Windows Editor Only) ---
+        private void CreateSynthesizer()
+        {
+            synthesizer = new SpeechSynthesizer();
+            synthesizer.Volume = 100;
+            selectedVoiceName = null; // New instance starts on the default voice
+        }
+
+        /// <summary>
+        /// Looks up the installed voice for the current voiceIndex and caches its name.
+        /// Sets cachedVoiceName to null (default voice) if no voices are installed. If enumeration
+        /// throws, nothing is cached and the lookup is retried on the next Speak().
+        /// </summary>
+        private void ResolveVoiceName(SpeechSynthesizer speechSynthesizer)
+        {
+            try {
+                 var voices = speechSynthesizer.GetInstalledVoices().Where(v => v.Enabled).ToList();
+                 if (voices.Count > 0) {
+                     cachedVoiceName = voices[Mathf.Clamp(voiceIndex, 0, voices.Count - 1)].VoiceInfo.Name;
+                     if (debugMode) Debug.Log($"[TTSManager EDITOR] Using voice '{cachedVoiceName}'.");
+                 } else {
+                     cachedVoiceName = null;
+                     LogWarning("No enabled voices found for System.Speech.");
+                 }
+                 resolvedVoiceIndex = voiceIndex;
+            } catch (Exception e) {
+                LogWarning($"Failed to enumerate voices (keeping the current voice, will retry): {e.Message}");
+            }
+        }
+
         private void StartLipSync(string text)
         {
             if (avatarAnimator == null || !isSpeaking) return;
@@ -340,8 +387,15 @@ namespace AI.Engine // Ensure this matches the folder structure or intended name
         }
         private void OnDestroy() {
              StopSpeaking();
-             // Dispose synthesizer if it was kept as a member?
-             // if(synthesizer != null) synthesizer.Dispose();
+             DisposeSynthesizer();
+        }
+
+        private void DisposeSynthesizer() {
+            if (synthesizer != null)
+            {
+                synthesizer.Dispose();
+                synthesizer = null;
+            }
         }
 
         #endif // End of UNITY_EDITOR_WIN block
@@ -27,11 +27,17 @@ public class ChatUIManager : UdonSharpBehaviour
     [Header("Proximity Settings")]
     public bool useProximity = true;
     public float proximityDistance = 3.0f;
+    [Tooltip("Seconds between proximity checks. Checking every frame is unnecessary for showing/hiding the panel.")]
+    public float proximityCheckInterval = 0.2f;
     [Tooltip("The GameObject whose position is used as the center for proximity checks.")]
     public Transform proximityOrigin;
 
     [Header("Chat Settings")]
     public int maxChatHistory = 20;
+    [Tooltip("Maximum number of player messages waiting for an AI response. Further messages get the busy response instead until the queue drains.")]
+    public int maxPendingMessages = 8;
+    [Tooltip("Bot reply shown (instead of an AI response) when a message is dropped because too many are pending.")]
+    public string busyResponse = "I'm still answering your earlier messages, please try again in a moment.";
     public string playerMessagePrefix = "[You]: ";
     // Bot prefix/suffix will be fetched from AIConfig via AIEngine
     private string botMessagePrefix = "[Bot]: "; // Default fallback
@@ -42,6 +48,25 @@ public class ChatUIManager : UdonSharpBehaviour
     private StringBuilder stringBuilder = new StringBuilder();
     private bool isInputFocused = false;
     private bool isInitialized = false;
+    private float nextProximityCheckTime = 0f;
+    private bool isDisplayRefreshPending = false; // A coalesced RefreshChatDisplay is scheduled for next frame
+
+    // Player messages waiting to be shown (ring buffer). Messages are accepted immediately and
+    // shown together with their answer, one AI exchange per frame, by ProcessPendingMessage.
+    // Messages dropped while maxPendingMessages are waiting for the AI go through the same queue
+    // (so chat order holds) as "busy" slots; consecutive drops share one slot, joined by
+    // DroppedMessageSeparator. Busy slots never outnumber AI slots by more than one, so
+    // 2 * maxPendingMessages + 1 slots always suffice.
+    private const char DroppedMessageSeparator = '\u001F';
+    private string[] pendingMessages;
+    private bool[] pendingIsBusy;
+    private int pendingHead = 0;
+    private int pendingCount = 0;   // Slots in use (AI + busy)
+    private int pendingAiCount = 0; // Slots waiting for an AI response
+    private int maxAiPending = 1;
+    private bool isProcessingScheduled = false;
+    private int droppedMessageCount = 0;
+    private bool isDropWarningLogged = false; // Only warn once per burst, not for every dropped message
 
     void Start()
     {
@@ -72,6 +97,7 @@ public class ChatUIManager : UdonSharpBehaviour
             LogError("AIEngine reference is not assigned! Chatbot cannot function.");
             // Display error message to user?
             DisplayBotMessage("Error: AI Engine not connected.");
+            RefreshChatDisplay(); // Show it now rather than waiting for the deferred refresh
             this.enabled = false; // Disable component if AI is missing
             return;
         }
@@ -106,6 +132,10 @@ public class ChatUIManager : UdonSharpBehaviour
             // Keep the default fallback values assigned above
         }
 
+        maxAiPending = Mathf.Max(1, maxPendingMessages);
+        pendingMessages = new string[maxAiPending * 2 + 1];
+        pendingIsBusy = new bool[pendingMessages.Length];
+
         playerInputField.text = "";
         // Ensure listeners are cleared before adding (prevents duplicates on re-compile/re-enable)
         playerInputField.onEndEdit.RemoveListener(OnInputFieldSubmit);
@@ -144,6 +174,11 @@ public class ChatUIManager : UdonSharpBehaviour
     {
         if (!useProximity || chatPanel == null || proximityOrigin == null || localPlayer == null) return;
 
+        // Throttle: the player can't move far between checks, so skip most frames
+        float currentTime = Time.time;
+        if (currentTime < nextProximityCheckTime) return;
+        nextProximityCheckTime = currentTime + proximityCheckInterval;
+
         // Use squared distance for slight performance improvement (avoids sqrt)
         float sqrDistance = Vector3.SqrMagnitude(localPlayer.GetPosition() - proximityOrigin.position);
         float sqrProximityDistance = proximityDistance * proximityDistance;
@@ -239,20 +274,113 @@ public class ChatUIManager : UdonSharpBehaviour
             return;
         }
 
-        // Display player message immediately for responsiveness
-        DisplayPlayerMessage(message);
+        // Too many messages already waiting for the AI: drop this one. It is still queued (and later
+        // shown with the busy response) so it appears in order, since the caller already cleared the input.
+        if (pendingAiCount >= maxAiPending)
+        {
+            int tail = (pendingHead + pendingCount - 1) % pendingMessages.Length;
+            if (pendingIsBusy[tail]) pendingMessages[tail] += DroppedMessageSeparator + message;
+            else EnqueuePending(message, true);
+
+            droppedMessageCount++;
+            if (!isDropWarningLogged)
+            {
+                isDropWarningLogged = true;
+                LogWarning("Too many pending messages, answering new messages with the busy response until the queue drains.");
+            }
+            ScheduleMessageProcessing();
+            return;
+        }
+
+        // Queue the message; it is displayed together with the AI response on the next frame
+        EnqueuePending(message, false);
+        pendingAiCount++;
+        ScheduleMessageProcessing();
+    }
+
+    private void EnqueuePending(string text, bool isBusy)
+    {
+        int index = (pendingHead + pendingCount) % pendingMessages.Length;
+        pendingMessages[index] = text;
+        pendingIsBusy[index] = isBusy;
+        pendingCount++;
+    }
+
+    private void ScheduleMessageProcessing()
+    {
+        if (isProcessingScheduled) return;
+        isProcessingScheduled = true;
+        SendCustomEventDelayedFrames(nameof(ProcessPendingMessage), 1);
+    }
+
+    // Public method callable by SendCustomEventDelayedFrames. Shows queued messages in order,
+    // answering at most one of them with the AI per call.
+    public void ProcessPendingMessage()
+    {
+        isProcessingScheduled = false;
+        if (pendingCount == 0) return;
+
+        if (aiEngine == null)
+        {
+            // Don't leave the queue stuck (every later message would get the busy response)
+            LogError($"AIEngine not available, discarding {pendingCount} pending queue slot(s).");
+            Array.Clear(pendingMessages, 0, pendingMessages.Length);
+            pendingHead = 0;
+            pendingCount = 0;
+            pendingAiCount = 0;
+            return;
+        }
+
+        string response = null;
+        while (pendingCount > 0)
+        {
+            string text = pendingMessages[pendingHead];
+            bool isBusy = pendingIsBusy[pendingHead];
+            pendingMessages[pendingHead] = null;
+            pendingHead = (pendingHead + 1) % pendingMessages.Length;
+            pendingCount--;
 
-        // Get response from AI Engine
-        string response = aiEngine.ProcessInput(message); // ProcessInput should handle its own errors/defaults
-        DisplayBotMessage(response);
+            if (isBusy)
+            {
+                // Dropped messages: show each with the busy response and keep going
+                string[] droppedMessages = text.Split(DroppedMessageSeparator);
+                for (int i = 0; i < droppedMessages.Length; i++)
+                {
+                    DisplayPlayerMessage(droppedMessages[i]);
+                    DisplayBotMessage(busyResponse);
+                }
+                continue;
+            }
+
+            // Get response from AI Engine
+            pendingAiCount--;
+            response = aiEngine.ProcessInput(text); // ProcessInput should handle its own errors/defaults
+            DisplayPlayerMessage(text);
+            DisplayBotMessage(response);
+            break; // One AI exchange per frame
+        }
+
+        // Show everything added above with a single rebuild (the scheduled flush becomes a no-op)
+        FlushChatDisplay();
 
         // Trigger TTS only if manager exists AND we are in the Windows Editor
         #if UNITY_EDITOR_WIN
-        if (ttsManager != null)
+        if (ttsManager != null && response != null)
         {
             ttsManager.Speak(response);
         }
         #endif
+
+        // Continue with the next queued message on the following frame
+        if (pendingCount > 0)
+        {
+            ScheduleMessageProcessing();
+        }
+        else if (isDropWarningLogged)
+        {
+            isDropWarningLogged = false;
+            Log($"Pending message queue drained ({droppedMessageCount} message(s) dropped so far).");
+        }
     }
 
     private void DisplayPlayerMessage(string message)
@@ -273,11 +401,25 @@ public class ChatUIManager : UdonSharpBehaviour
             chatHistory.RemoveAt(0); // Remove the oldest message
         }
         chatHistory.Add(message);
+
+        // Coalesce refreshes: several messages added in the same frame only rebuild the display text once.
+        if (!isDisplayRefreshPending)
+        {
+            isDisplayRefreshPending = true;
+            SendCustomEventDelayedFrames(nameof(FlushChatDisplay), 1);
+        }
+    }
+
+    // Public method callable by SendCustomEventDelayedFrames
+    public void FlushChatDisplay()
+    {
+        if (!isDisplayRefreshPending) return; // Already refreshed (e.g. by HandleProximity)
         RefreshChatDisplay();
     }
 
     private void RefreshChatDisplay()
     {
+        isDisplayRefreshPending = false;
         if (chatDisplayArea == null) return;
 
         stringBuilder.Clear();